@@ -1,22 +1,23 @@
 from feedgen.feed import FeedGenerator
 from datetime import datetime
+from urllib.parse import quote
 import pytz
 
+GITHUB_PAGES_BASE_URL = "https://dbirks.github.io/ai-generated-podcast"
+EPISODE_BASE_URL = "https://birkspublic.blob.core.windows.net/aigeneratedpodcast"
+EPISODE_URL_TEMPLATE = EPISODE_BASE_URL + "/%s.m4a"
 
-def main():
-    github_pages_base_url = "https://dbirks.github.io/ai-generated-podcast"
-    episode_base_url = "https://birkspublic.blob.core.windows.net/aigeneratedpodcast"
 
+def main():
     fg = FeedGenerator()
 
     fg.load_extension("podcast")
     fg.podcast.itunes_category("Technology", "Podcasting")
-    fg.link(href=github_pages_base_url, rel="alternate")
+    fg.link(href=GITHUB_PAGES_BASE_URL, rel="alternate")
     fg.title("AI-generated podcast")
     fg.description(
         "My personal podcast feed for some topics I want to learn more about."
     )
-    fg.rss_str(pretty=True)
 
     episodes = [
         {
@@ -32,8 +33,11 @@ def main():
     ]
 
     for episode in episodes:
-        url = f"{episode_base_url}/{episode['title']}.m4a"
         title = episode["title"]
+        # Titles contain spaces, so the enclosure URL must be escaped. The guid
+        # keeps the unescaped form so podcast apps don't re-download old episodes.
+        guid = EPISODE_URL_TEMPLATE % title
+        url = EPISODE_URL_TEMPLATE % quote(title, safe="")
         description = episode["description"]
         published_date = datetime.strptime(
             episode["published_date"], "%Y-%m-%dT%H:%M:%S%z"
@@ -41,17 +45,18 @@ def main():
         print(f"Adding episode: {title}")
 
         fe = fg.add_entry()
-        fe.id(url)
+        fe.id(guid)
         fe.title(title)
         fe.description(description)
         fe.enclosure(url, 0, "audio/mp4")
         fe.published(published_date)
 
-    fg.rss_file("rss.xml")
+    rss = fg.rss_str()
+    with open("rss.xml", "wb") as f:
+        f.write(rss)
 
     print("Pasting the generated RSS feed below:")
-    with open("rss.xml", "r") as f:
-        print(f.read())
+    print(rss.decode("utf-8"))
 
 
 if __name__ == "__main__":